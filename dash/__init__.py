@@ -1,5 +1,14 @@
 """Dash - A self-learning data agent with 6 layers of context."""
 
-from dash.agents import dash, dash_knowledge, dash_learnings, reasoning_dash
+from typing import Any
 
 __all__ = ["dash", "reasoning_dash", "dash_knowledge", "dash_learnings"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer building agents (and importing Agno) until an export is first used
+    if name in __all__:
+        from dash import agents
+
+        return getattr(agents, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
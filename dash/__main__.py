@@ -2,7 +2,7 @@
 
 import asyncio
 
-from dash.agents import dash
+from dash.agents import get_dash_agent
 
 if __name__ == "__main__":
-    asyncio.run(dash.acli_app(stream=True))
+    asyncio.run(get_dash_agent().acli_app(stream=True))
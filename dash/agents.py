@@ -5,85 +5,49 @@ Dash Agents (Local Ollama Edition)
 Connects to a local Ollama instance for LLM inference and SQL Server for data.
 No API keys required — everything runs on your machine.
 
+Agents, knowledge bases, and tools are built on first use by the cached get_*
+factories, so importing this module (e.g. for `python -m dash`) does not load
+the Agno stack, pgvector, or the FastEmbed/ONNX runtime until they are needed.
+`from dash.agents import dash` still works and builds the agent on access.
+
 Test: python -m dash.agents
 """
 
+from functools import cache
+from hashlib import sha1
 from os import getenv
+from typing import TYPE_CHECKING, Any
 
-from agno.agent import Agent
-from agno.knowledge import Knowledge
-from agno.knowledge.embedder.fastembed import FastEmbedEmbedder
-from agno.learn import (
-    LearnedKnowledgeConfig,
-    LearningMachine,
-    LearningMode,
-    UserMemoryConfig,
-    UserProfileConfig,
-)
-from agno.models.ollama import Ollama
-from agno.tools.reasoning import ReasoningTools
-from agno.tools.sql import SQLTools
-from agno.vectordb.pgvector import PgVector, SearchType
+from agno.utils.log import logger
 
 from dash.context.business_rules import BUSINESS_CONTEXT
 from dash.context.semantic_model import SEMANTIC_MODEL_STR
-from dash.tools import create_introspect_schema_tool, create_save_validated_query_tool
-from db import agent_db_url, data_db_url, get_postgres_db
-
-# ============================================================================
-# Configuration
-# ============================================================================
-
-OLLAMA_HOST = getenv("OLLAMA_HOST", "http://localhost:11434")
-OLLAMA_MODEL = getenv("OLLAMA_MODEL", "qwen3:14b")
 
-# ============================================================================
-# Database & Knowledge
-# ============================================================================
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.knowledge import Knowledge
+    from agno.learn import LearningMachine
+    from agno.models.ollama import Ollama
+    from agno.vectordb.pgvector import HNSW
 
-agent_db = get_postgres_db()
-
-# KNOWLEDGE: Static, curated (table schemas, validated queries, business rules)
-dash_knowledge = Knowledge(
-    name="Dash Knowledge",
-    vector_db=PgVector(
-        db_url=agent_db_url,
-        table_name="dash_knowledge",
-        search_type=SearchType.hybrid,
-        embedder=FastEmbedEmbedder(),
-    ),
-    contents_db=get_postgres_db(contents_table="dash_knowledge_contents"),
-)
-
-# LEARNINGS: Dynamic, discovered (error patterns, gotchas, user corrections)
-dash_learnings = Knowledge(
-    name="Dash Learnings",
-    vector_db=PgVector(
-        db_url=agent_db_url,
-        table_name="dash_learnings",
-        search_type=SearchType.hybrid,
-        embedder=FastEmbedEmbedder(),
-    ),
-    contents_db=get_postgres_db(contents_table="dash_learnings_contents"),
-)
+    from dash.embedder import CachedFastEmbedEmbedder
 
 # ============================================================================
-# Tools
+# Configuration
 # ============================================================================
 
-save_validated_query = create_save_validated_query_tool(dash_knowledge)
-introspect_schema = create_introspect_schema_tool(data_db_url)
-
-# MCP/Exa web search is excluded — this is a local-only, air-gapped setup.
-# Add it back by uncommenting if you later want web research capability:
-# from agno.tools.mcp import MCPTools
-# MCPTools(url=f"https://mcp.exa.ai/mcp?exaApiKey={getenv('EXA_API_KEY', '')}&tools=web_search_exa"),
+# Defaults for the OLLAMA_HOST / OLLAMA_MODEL / OLLAMA_KEEP_ALIVE / OLLAMA_NUM_CTX environment
+# variables. They are read in get_model(), after db has loaded .env, not at import.
+DEFAULT_OLLAMA_HOST = "http://localhost:11434"
+DEFAULT_OLLAMA_MODEL = "qwen3:14b"
+# Ollama unloads an idle model after 5 minutes, and reloading it discards the KV cache
+DEFAULT_OLLAMA_KEEP_ALIVE = "24h"
+DEFAULT_OLLAMA_NUM_CTX = 8192
 
-base_tools: list = [
-    SQLTools(db_url=data_db_url),
-    save_validated_query,
-    introspect_schema,
-]
+# Connection pool for the Ollama httpx clients. httpx drops idle connections after 5s by default,
+# which is shorter than the gap between most chat turns; keep them around so each turn reuses one.
+OLLAMA_MAX_CONNECTIONS = 20
+OLLAMA_KEEPALIVE_EXPIRY = 300.0
 
 # ============================================================================
 # Instructions
@@ -168,41 +132,259 @@ After discovering table relationships — how fact tables join to reference view
 {BUSINESS_CONTEXT}\
 """
 
+# INSTRUCTIONS is the first block of the system message and is built from sorted knowledge
+# files, so it is byte-identical across runs. Prompt caching (Ollama's KV cache, provider
+# prefix caches) only hits while it stays that way; get_model() logs the hash to spot drift.
+INSTRUCTIONS_HASH = sha1(INSTRUCTIONS.encode()).hexdigest()[:8]
+
+
+@cache
+def get_instructions_token_count() -> int:
+    """Token count of INSTRUCTIONS, computed once.
+
+    Uses tiktoken's o200k_base encoding when installed (close to Qwen's tokenizer for
+    English and SQL), otherwise ~4 chars per token. tiktoken downloads the encoding on
+    first use, which fails on an offline host; that also falls back to the estimate.
+    Sizes Ollama's num_keep so the instructions stay at the front of the KV cache when
+    the context shifts.
+    """
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")
+    except ImportError:
+        return len(INSTRUCTIONS) // 4
+    except (OSError, ValueError) as e:
+        # tiktoken raises requests errors (OSError subclasses) offline, ValueError on a bad download
+        logger.warning(f"tiktoken encoding unavailable, estimating instruction tokens: {e}")
+        return len(INSTRUCTIONS) // 4
+    return len(encoding.encode(INSTRUCTIONS, disallowed_special=()))
+
+
+# ============================================================================
+# Database & Knowledge
+# ============================================================================
+
+
+@cache
+def get_embedder() -> "CachedFastEmbedEmbedder":
+    """One embedder (one ONNX model in memory, one cache connection) for every vector store."""
+    from dash.embedder import CachedFastEmbedEmbedder
+
+    return CachedFastEmbedEmbedder()
+
+
+def _vector_index() -> "HNSW":
+    """HNSW index settings for a knowledge table (a fresh instance per table: PgVector names it).
+
+    Both tables use hybrid search, which keeps keyword ranking for exact table and column names.
+    Agno's hybrid query orders every row by a computed score, so it is a sequential scan and never
+    uses this index (or a full-text one); on tables of a few hundred rows that costs little. The
+    index only serves SearchType.vector queries, where ef_search=40 (pgvector's default; Agno's
+    default of 5 trades away recall) applies. It is built by `python -m dash.scripts.load_knowledge`.
+    """
+    from agno.vectordb.pgvector import HNSW
+
+    return HNSW(m=16, ef_construction=64, ef_search=40)
+
+
+@cache
+def get_dash_knowledge() -> "Knowledge":
+    """KNOWLEDGE: Static, curated (table schemas, validated queries, business rules)."""
+    from agno.knowledge import Knowledge
+    from agno.vectordb.pgvector import PgVector, SearchType
+
+    from db import agent_db_url, get_postgres_db, get_sql_engine
+
+    return Knowledge(
+        name="Dash Knowledge",
+        vector_db=PgVector(
+            db_engine=get_sql_engine(agent_db_url),
+            table_name="dash_knowledge",
+            search_type=SearchType.hybrid,
+            vector_index=_vector_index(),
+            embedder=get_embedder(),
+        ),
+        contents_db=get_postgres_db(contents_table="dash_knowledge_contents"),
+    )
+
+
+@cache
+def get_dash_learnings() -> "Knowledge":
+    """LEARNINGS: Dynamic, discovered (error patterns, gotchas, user corrections)."""
+    from agno.knowledge import Knowledge
+    from agno.vectordb.pgvector import PgVector, SearchType
+
+    from db import agent_db_url, get_postgres_db, get_sql_engine
+
+    return Knowledge(
+        name="Dash Learnings",
+        vector_db=PgVector(
+            db_engine=get_sql_engine(agent_db_url),
+            table_name="dash_learnings",
+            search_type=SearchType.hybrid,
+            vector_index=_vector_index(),
+            embedder=get_embedder(),
+        ),
+        contents_db=get_postgres_db(contents_table="dash_learnings_contents"),
+    )
+
+
+# ============================================================================
+# Tools
+# ============================================================================
+
+# MCP/Exa web search is excluded — this is a local-only, air-gapped setup.
+# Add it back to get_base_tools() if you later want web research capability. Keep it a single
+# instance in the cached tool list: AgentOS connects collected MCPTools once in its app lifespan,
+# and both dash and reasoning_dash reference that list, so one session serves every run.
+# from agno.tools.mcp import MCPTools
+# MCPTools(
+#     url=f"https://mcp.exa.ai/mcp?exaApiKey={getenv('EXA_API_KEY', '')}&tools=web_search_exa",
+#     transport="streamable-http",
+# ),
+
+
+@cache
+def get_base_tools() -> list:
+    """Tools shared by dash and reasoning_dash."""
+    from agno.tools.sql import SQLTools
+
+    from dash.tools import create_introspect_schema_tool, create_save_validated_query_tool
+    from db import data_db_url, get_sql_engine
+
+    return [
+        SQLTools(db_engine=get_sql_engine(data_db_url)),
+        create_save_validated_query_tool(get_dash_knowledge()),
+        create_introspect_schema_tool(data_db_url),
+    ]
+
+
 # ============================================================================
 # Create Agent
 # ============================================================================
 
-dash = Agent(
-    name="Dash",
-    model=Ollama(id=OLLAMA_MODEL, host=OLLAMA_HOST),
-    db=agent_db,
-    instructions=INSTRUCTIONS,
-    # Knowledge (static)
-    knowledge=dash_knowledge,
-    search_knowledge=True,
-    # Learning (provides search_learnings, save_learning, user profile, user memory)
-    learning=LearningMachine(
-        knowledge=dash_learnings,
+
+@cache
+def get_model() -> "Ollama":
+    """The Ollama model shared by dash and reasoning_dash (and so its HTTP connection pool)."""
+    import httpx
+    from agno.models.ollama import Ollama
+
+    import db.url  # noqa: F401 - loads .env, which may set the OLLAMA_* variables read below
+
+    num_ctx = int(getenv("OLLAMA_NUM_CTX", str(DEFAULT_OLLAMA_NUM_CTX)))
+    instructions_tokens = get_instructions_token_count()
+    logger.info(
+        f"Dash instructions: {len(INSTRUCTIONS):,} chars, ~{instructions_tokens:,} tokens, hash {INSTRUCTIONS_HASH}"
+    )
+    if instructions_tokens > num_ctx // 2:
+        logger.warning(
+            f"Dash instructions use ~{instructions_tokens:,} of {num_ctx:,} context tokens; "
+            "raise OLLAMA_NUM_CTX to leave room for history and tool results"
+        )
+
+    return Ollama(
+        id=getenv("OLLAMA_MODEL", DEFAULT_OLLAMA_MODEL),
+        host=getenv("OLLAMA_HOST", DEFAULT_OLLAMA_HOST),
+        keep_alive=getenv("OLLAMA_KEEP_ALIVE", DEFAULT_OLLAMA_KEEP_ALIVE),
+        options={
+            "num_ctx": num_ctx,
+            "num_batch": 512,
+            "num_keep": min(instructions_tokens, num_ctx // 2),
+        },
+        client_params={
+            "limits": httpx.Limits(
+                max_connections=OLLAMA_MAX_CONNECTIONS,
+                max_keepalive_connections=OLLAMA_MAX_CONNECTIONS,
+                keepalive_expiry=OLLAMA_KEEPALIVE_EXPIRY,
+            )
+        },
+    )
+
+
+@cache
+def get_learning_machine() -> "LearningMachine":
+    """Learning (provides search_learnings, save_learning, user profile, user memory)."""
+    from agno.learn import (
+        LearnedKnowledgeConfig,
+        LearningMachine,
+        LearningMode,
+        UserMemoryConfig,
+        UserProfileConfig,
+    )
+
+    return LearningMachine(
+        knowledge=get_dash_learnings(),
         user_profile=UserProfileConfig(mode=LearningMode.AGENTIC),
         user_memory=UserMemoryConfig(mode=LearningMode.AGENTIC),
         learned_knowledge=LearnedKnowledgeConfig(mode=LearningMode.AGENTIC),
-    ),
-    tools=base_tools,
-    # Context
-    add_datetime_to_context=True,
-    add_history_to_context=True,
-    read_chat_history=True,
-    num_history_runs=5,
-    markdown=True,
-)
-
-# Reasoning variant - adds multi-step reasoning capabilities
-reasoning_dash = dash.deep_copy(
-    update={
-        "name": "Reasoning Dash",
-        "tools": base_tools + [ReasoningTools(add_instructions=True)],
+    )
+
+
+def _agent_config() -> dict[str, Any]:
+    """Agent settings shared by dash and reasoning_dash.
+
+    The model, db, knowledge and learning objects are cached, so both agents hold
+    the same instances instead of copies.
+    """
+    from db import get_postgres_db
+
+    return {
+        "model": get_model(),
+        "db": get_postgres_db(),
+        "instructions": INSTRUCTIONS,
+        # Knowledge (static)
+        "knowledge": get_dash_knowledge(),
+        "search_knowledge": True,
+        # Learning
+        "learning": get_learning_machine(),
+        # Context
+        "add_datetime_to_context": True,
+        "add_history_to_context": True,
+        "read_chat_history": True,
+        "num_history_runs": 5,
+        "markdown": True,
     }
-)
+
+
+@cache
+def get_dash_agent() -> "Agent":
+    """Build the Dash agent."""
+    from agno.agent import Agent
+
+    return Agent(name="Dash", tools=get_base_tools(), **_agent_config())
+
+
+@cache
+def get_reasoning_dash_agent() -> "Agent":
+    """Reasoning variant - adds multi-step reasoning capabilities."""
+    from agno.agent import Agent
+    from agno.tools.reasoning import ReasoningTools
+
+    return Agent(
+        name="Reasoning Dash",
+        tools=get_base_tools() + [ReasoningTools(add_instructions=True)],
+        **_agent_config(),
+    )
+
+
+# Module attributes built on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "dash": get_dash_agent,
+    "reasoning_dash": get_reasoning_dash_agent,
+    "dash_knowledge": get_dash_knowledge,
+    "dash_learnings": get_dash_learnings,
+    "base_tools": get_base_tools,
+}
+
+
+def __getattr__(name: str) -> Any:
+    factory = _LAZY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
+
 
 if __name__ == "__main__":
-    dash.print_response("What tables are available and what data do they contain?", stream=True)
+    get_dash_agent().print_response("What tables are available and what data do they contain?", stream=True)
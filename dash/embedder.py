@@ -0,0 +1,143 @@
+"""FastEmbed embedder with batching and an on-disk embedding cache."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from agno.knowledge.embedder.fastembed import FastEmbedEmbedder
+from agno.utils.log import logger
+from fastembed import TextEmbedding
+
+from dash.paths import CACHE_DIR
+
+EMBEDDING_CACHE_PATH = CACHE_DIR / "embeddings.sqlite"
+
+# ONNX Runtime intra-op threads. ORT defaults to one per core, which oversubscribes the CPU
+# while Ollama is generating on the same machine.
+EMBEDDING_THREADS = int(os.getenv("EMBEDDING_THREADS", "0")) or max(1, (os.cpu_count() or 2) // 2)
+
+
+@dataclass
+class CachedFastEmbedEmbedder(FastEmbedEmbedder):
+    """FastEmbedEmbedder that reuses one model, embeds in batches, and caches results on disk.
+
+    The base class loads the ONNX model on every call and embeds one text at a time.
+    Here the model is loaded once on first use, knowledge ingestion embeds batch_size
+    texts per call, and ingested embeddings are cached by SHA-256 of (model id, text) so
+    reloading unchanged knowledge embeds nothing. Single-text embeddings (search queries)
+    read the cache but are not written to it, so the cache only grows with the knowledge.
+
+    The default model (BAAI/bge-small-en-v1.5) is served by FastEmbed from an INT8-quantized,
+    graph-optimized ONNX export, so it runs on the CPU provider with a bounded thread count.
+    Its 384-d vectors are already compact; BGE is not Matryoshka-trained, so truncating them
+    further would cost recall rather than just precision.
+    """
+
+    enable_batch: bool = True
+    batch_size: int = 256
+    cache_path: Path | None = EMBEDDING_CACHE_PATH
+    threads: int | None = EMBEDDING_THREADS
+    providers: list[str] | None = field(default_factory=lambda: ["CPUExecutionProvider"])
+
+    _model: TextEmbedding | None = field(default=None, init=False, repr=False)
+    _cache: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _get_model(self) -> TextEmbedding:
+        with self._lock:
+            if self._model is None:
+                self._model = TextEmbedding(model_name=self.id, threads=self.threads, providers=self.providers)
+            return self._model
+
+    def _get_cache(self) -> sqlite3.Connection | None:
+        if self.cache_path is None:
+            return None
+        if self._cache is None:
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                # An unwritable cache directory should not stop embedding; run without the cache
+                logger.warning(f"Embedding cache disabled: {e}")
+                self.cache_path = None
+                return None
+            self._cache = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._cache.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)")
+        return self._cache
+
+    def _cache_key(self, text: str) -> str:
+        return sha256(f"{self.id}\0{text}".encode()).hexdigest()
+
+    def _cache_get(self, keys: list[str]) -> dict[str, list[float]]:
+        with self._lock:
+            cache = self._get_cache()
+            if cache is None or not keys:
+                return {}
+            found: dict[str, list[float]] = {}
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = cache.execute(f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})", chunk)
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+            return found
+
+    def _cache_put(self, items: dict[str, list[float]]) -> None:
+        with self._lock:
+            cache = self._get_cache()
+            if cache is None or not items:
+                return
+            cache.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+                [(key, np.asarray(emb, dtype=np.float32).tobytes()) for key, emb in items.items()],
+            )
+            cache.commit()
+
+    def get_embeddings(self, texts: list[str], store: bool = True) -> list[list[float]]:
+        """Embed texts, reading cached embeddings and embedding the rest in batches.
+
+        New embeddings are written to the cache unless store is False.
+        """
+        keys = [self._cache_key(t) for t in texts]
+        try:
+            cached = self._cache_get(keys)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            cached = {}
+
+        missing = {k: t for k, t in zip(keys, texts) if k not in cached}
+        if missing:
+            model = self._get_model()
+            embedded = {
+                k: np.asarray(emb).tolist()
+                for k, emb in zip(missing, model.embed(list(missing.values()), batch_size=self.batch_size))
+            }
+            if store:
+                try:
+                    self._cache_put(embedded)
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache write failed: {e}")
+            cached.update(embedded)
+
+        return [cached[k] for k in keys]
+
+    def get_embedding(self, text: str) -> list[float]:
+        # Query-time path: keep the per-question SQLite write and commit off the request
+        try:
+            return self.get_embeddings([text], store=False)[0]
+        except Exception as e:
+            logger.warning(e)
+            return []
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: list[str]
+    ) -> tuple[list[list[float]], list[dict[str, Any] | None]]:
+        """Batch entry point used by PgVector when enable_batch is set."""
+        embeddings = await asyncio.to_thread(self.get_embeddings, texts)
+        return embeddings, [None] * len(embeddings)
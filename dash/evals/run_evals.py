@@ -7,21 +7,24 @@ Usage:
     python -m dash.evals.run_evals --verbose
     python -m dash.evals.run_evals --llm-grader
     python -m dash.evals.run_evals --compare-results
+    python -m dash.evals.run_evals --concurrency 4
 """
 
 import argparse
+import asyncio
 import time
 from typing import TypedDict
+from uuid import uuid4
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 from rich.table import Table
 from rich.text import Text
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
 from dash.evals.test_cases import CATEGORIES, TEST_CASES, TestCase
-from db import db_url
+from db import db_url, get_sql_engine
 
 
 class EvalResult(TypedDict, total=False):
@@ -44,7 +47,7 @@ console = Console()
 
 def execute_golden_sql(sql: str) -> list[dict]:
     """Execute a golden SQL query and return results as list of dicts."""
-    engine = create_engine(db_url)
+    engine = get_sql_engine(db_url)
     with engine.connect() as conn:
         result = conn.execute(text(sql))
         columns = list(result.keys())
@@ -57,11 +60,64 @@ def check_strings_in_response(response: str, expected: list[str]) -> list[str]:
     return [v for v in expected if v.lower() not in response_lower]
 
 
+async def run_test(
+    agent,
+    test_case: TestCase,
+    verbose: bool = False,
+    llm_grader: bool = False,
+    compare_results: bool = False,
+) -> EvalResult:
+    """Run a single test case against the agent and evaluate the response."""
+    test_start = time.time()
+
+    try:
+        # A fresh session per test: without one the agent reuses the first generated session_id,
+        # so concurrent (and even sequential) tests would share chat history
+        result = await agent.arun(test_case.question, session_id=str(uuid4()))
+        response = result.content or ""
+        duration = time.time() - test_start
+
+        # Evaluate the response (golden SQL and the LLM grader block, so keep them off the event loop)
+        eval_result = await asyncio.to_thread(
+            evaluate_response,
+            test_case=test_case,
+            response=response,
+            llm_grader=llm_grader,
+            compare_results=compare_results,
+        )
+
+        return {
+            "status": eval_result["status"],
+            "question": test_case.question,
+            "category": test_case.category,
+            "missing": eval_result.get("missing"),
+            "duration": duration,
+            "response": response if verbose else None,
+            "llm_grade": eval_result.get("llm_grade"),
+            "llm_reasoning": eval_result.get("llm_reasoning"),
+            "result_match": eval_result.get("result_match"),
+            "result_explanation": eval_result.get("result_explanation"),
+        }
+
+    except Exception as e:
+        duration = time.time() - test_start
+        return {
+            "status": "ERROR",
+            "question": test_case.question,
+            "category": test_case.category,
+            "missing": None,
+            "duration": duration,
+            "error": str(e),
+            "response": None,
+        }
+
+
 def run_evals(
     category: str | None = None,
     verbose: bool = False,
     llm_grader: bool = False,
     compare_results: bool = False,
+    concurrency: int = 1,
 ):
     """
     Run evaluation suite.
@@ -71,6 +127,7 @@ def run_evals(
         verbose: Show full responses on failure
         llm_grader: Use LLM to grade responses
         compare_results: Compare actual results against golden SQL results
+        concurrency: Number of tests to run at once
     """
     from dash.agents import dash
 
@@ -99,7 +156,6 @@ def run_evals(
         )
     )
 
-    results: list[EvalResult] = []
     start = time.time()
 
     with Progress(
@@ -110,54 +166,27 @@ def run_evals(
         console=console,
     ) as progress:
         task = progress.add_task("Evaluating...", total=len(tests))
-
-        for test_case in tests:
-            progress.update(task, description=f"[cyan]{test_case.question[:40]}...[/cyan]")
-            test_start = time.time()
-
-            try:
-                result = dash.run(test_case.question)
-                response = result.content or ""
-                duration = time.time() - test_start
-
-                # Evaluate the response
-                eval_result = evaluate_response(
-                    test_case=test_case,
-                    response=response,
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(test_case: TestCase) -> EvalResult:
+            async with semaphore:
+                progress.update(task, description=f"[cyan]{test_case.question[:40]}...[/cyan]")
+                # Concurrent runs each get their own copy, as AgentOS does per request
+                result = await run_test(
+                    dash.deep_copy() if concurrency > 1 else dash,
+                    test_case,
+                    verbose=verbose,
                     llm_grader=llm_grader,
                     compare_results=compare_results,
                 )
+                progress.advance(task)
+                return result
 
-                results.append(
-                    {
-                        "status": eval_result["status"],
-                        "question": test_case.question,
-                        "category": test_case.category,
-                        "missing": eval_result.get("missing"),
-                        "duration": duration,
-                        "response": response if verbose else None,
-                        "llm_grade": eval_result.get("llm_grade"),
-                        "llm_reasoning": eval_result.get("llm_reasoning"),
-                        "result_match": eval_result.get("result_match"),
-                        "result_explanation": eval_result.get("result_explanation"),
-                    }
-                )
-
-            except Exception as e:
-                duration = time.time() - test_start
-                results.append(
-                    {
-                        "status": "ERROR",
-                        "question": test_case.question,
-                        "category": test_case.category,
-                        "missing": None,
-                        "duration": duration,
-                        "error": str(e),
-                        "response": None,
-                    }
-                )
+        async def run_all() -> list[EvalResult]:
+            # gather keeps results in test order regardless of completion order
+            return await asyncio.gather(*(run_one(tc) for tc in tests))
 
-            progress.advance(task)
+        results = asyncio.run(run_all())
 
     total_duration = time.time() - start
 
@@ -399,6 +428,13 @@ if __name__ == "__main__":
         action="store_true",
         help="Compare against golden SQL results where available",
     )
+    parser.add_argument(
+        "--concurrency",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of tests to run at once (set OLLAMA_NUM_PARALLEL to match)",
+    )
     args = parser.parse_args()
 
     run_evals(
@@ -406,4 +442,5 @@ if __name__ == "__main__":
         verbose=args.verbose,
         llm_grader=args.llm_grader,
         compare_results=args.compare_results,
+        concurrency=args.concurrency,
     )
@@ -8,3 +8,4 @@ KNOWLEDGE_DIR = DASH_DIR / "knowledge"
 TABLES_DIR = KNOWLEDGE_DIR / "tables"
 BUSINESS_DIR = KNOWLEDGE_DIR / "business"
 QUERIES_DIR = KNOWLEDGE_DIR / "queries"
+CACHE_DIR = PROJECT_ROOT / ".cache"
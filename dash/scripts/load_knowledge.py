@@ -1,15 +1,54 @@
 """
 Load Knowledge - Loads table metadata, queries, and business rules into knowledge base.
 
+Documents are inserted through Knowledge.ainsert, so each batch of chunks is
+embedded in one call and written with a single multi-row statement.
+
+An HNSW index on the embeddings is created after loading, for both the
+knowledge and learnings tables.
+
 Usage:
     python -m dash.scripts.load_knowledge             # Upsert (update existing)
     python -m dash.scripts.load_knowledge --recreate  # Drop and reload all
 """
 
 import argparse
+import asyncio
+from typing import TYPE_CHECKING
 
 from dash.paths import KNOWLEDGE_DIR
 
+if TYPE_CHECKING:
+    from agno.knowledge import Knowledge
+
+
+def create_search_indexes(knowledge: "Knowledge") -> None:
+    """Create the HNSW index for vector search, if missing.
+
+    The knowledge tables use hybrid search. Agno's hybrid and keyword queries rank every
+    row (no @@ predicate), so they scan the table and use neither this index nor a
+    full-text one. No full-text index is kept; any left by an earlier load is dropped.
+    """
+    from agno.vectordb.pgvector import HNSW, PgVector
+    from sqlalchemy import text
+
+    vector_db = knowledge.vector_db
+    if not isinstance(vector_db, PgVector) or not isinstance(vector_db.vector_index, HNSW):
+        return
+
+    index = vector_db.vector_index
+    table = vector_db.table.fullname
+    with vector_db.db_engine.begin() as conn:
+        conn.execute(
+            text(
+                f'CREATE INDEX IF NOT EXISTS "{vector_db.table_name}_hnsw_index" ON {table} '
+                f"USING hnsw (embedding vector_cosine_ops) "
+                f"WITH (m = {index.m}, ef_construction = {index.ef_construction})"
+            )
+        )
+        conn.execute(text(f'DROP INDEX IF EXISTS {vector_db.schema}."{vector_db.table_name}_content_gin_index"'))
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Load knowledge into vector database")
     parser.add_argument(
@@ -19,7 +58,7 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    from dash.agents import dash_knowledge
+    from dash.agents import dash_knowledge, dash_learnings
 
     if args.recreate:
         print("Recreating knowledge base (dropping existing data)...\n")
@@ -29,16 +68,24 @@ if __name__ == "__main__":
 
     print(f"Loading knowledge from: {KNOWLEDGE_DIR}\n")
 
-    for subdir in ["tables", "queries", "business"]:
-        path = KNOWLEDGE_DIR / subdir
-        if not path.exists():
-            print(f"  {subdir}/: (not found)")
-            continue
+    async def load() -> None:
+        for subdir in ["tables", "queries", "business"]:
+            path = KNOWLEDGE_DIR / subdir
+            if not path.exists():
+                print(f"  {subdir}/: (not found)")
+                continue
+
+            files = [f for f in path.iterdir() if f.is_file() and not f.name.startswith(".")]
+            print(f"  {subdir}/: {len(files)} files")
+
+            if files:
+                # The async path batches embeddings (the sync one embeds chunk by chunk)
+                await dash_knowledge.ainsert(name=f"knowledge-{subdir}", path=str(path))
 
-        files = [f for f in path.iterdir() if f.is_file() and not f.name.startswith(".")]
-        print(f"  {subdir}/: {len(files)} files")
+    asyncio.run(load())
 
-        if files:
-            dash_knowledge.insert(name=f"knowledge-{subdir}", path=str(path))
+    print("\nCreating vector indexes...")
+    for knowledge in (dash_knowledge, dash_learnings):
+        create_search_indexes(knowledge)
 
     print("\nDone!")
@@ -2,29 +2,275 @@
 
 Supports SQL Server (T-SQL) syntax: uses square brackets for identifiers,
 TOP instead of LIMIT, and includes views in table listings.
+
+Reflected metadata (table/view names, columns, primary keys, row counts) is
+cached per database for SCHEMA_CACHE_TTL seconds. Pass refresh=True to rebuild.
 """
 
+import difflib
+import threading
+import time
+from dataclasses import dataclass, field
+
 from agno.tools import tool
 from agno.utils.log import logger
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine, Inspector
+from sqlalchemy.engine.interfaces import ReflectedColumn, ReflectedPrimaryKeyConstraint
 from sqlalchemy.exc import DatabaseError, OperationalError
 
+from db.session import get_sql_engine
+
+SCHEMA_CACHE_TTL = 300  # seconds
+
+
+@dataclass
+class _SchemaCache:
+    """Reflected schema metadata for one database."""
+
+    inspector: Inspector
+    fetched_at: float
+    tables: list[str]
+    views: list[str]
+    row_counts: dict[str, int | None] | None = None
+    columns: dict[str, list[ReflectedColumn]] = field(default_factory=dict)
+    pk_constraints: dict[str, ReflectedPrimaryKeyConstraint] = field(default_factory=dict)
+    # Lowercased name -> actual name, for case-insensitive lookup (SQL Server is case-insensitive)
+    name_index: dict[str, str] = field(init=False)
+    # Guards the lazy fills below: the Inspector is shared by every thread using this cache
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.name_index = {o.lower(): o for o in self.tables + self.views}
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self.fetched_at >= SCHEMA_CACHE_TTL
+
+    def get_columns(self, table_name: str) -> list[ReflectedColumn]:
+        with self.lock:
+            if table_name not in self.columns:
+                self.columns[table_name] = self.inspector.get_columns(table_name)
+            return self.columns[table_name]
+
+    def get_pk_constraint(self, table_name: str) -> ReflectedPrimaryKeyConstraint:
+        with self.lock:
+            if table_name not in self.pk_constraints:
+                self.pk_constraints[table_name] = self.inspector.get_pk_constraint(table_name)
+            return self.pk_constraints[table_name]
+
+    def get_row_counts(self, engine: Engine) -> dict[str, int | None]:
+        with self.lock:
+            if self.row_counts is None:
+                try:
+                    self.row_counts = _fetch_row_counts(engine, self.tables)
+                except (OperationalError, DatabaseError) as e:
+                    logger.warning(f"Could not read row counts: {e}")
+                    self.row_counts = {}
+            return self.row_counts
+
+    def resolve(self, name: str) -> str | None:
+        """Return the actual table/view name for a case-insensitive match, or None."""
+        return self.name_index.get(name.lower())
+
+    def suggest(self, name: str, n: int = 5) -> list[str]:
+        """Return up to n table/view names that closely match a misspelled name."""
+        matches = difflib.get_close_matches(name.lower(), self.name_index, n=n, cutoff=0.5)
+        return [self.name_index[m] for m in matches]
+
+
+# Keyed by database URL so every tool created for the same database shares one cache.
+# Parallel tool calls run in worker threads: building an entry is serialized by the module lock,
+# and each entry's lazy reflection (columns, primary keys, row counts) by its own lock.
+_schema_caches: dict[str, _SchemaCache] = {}
+_schema_caches_lock = threading.Lock()
+
+
+def _get_schema_cache(db_url: str, engine: Engine, refresh: bool = False) -> _SchemaCache:
+    """Return cached schema metadata, reflecting again if missing, stale, or refresh is set."""
+    with _schema_caches_lock:
+        cache = _schema_caches.get(db_url)
+        if refresh or cache is None or cache.is_stale():
+            insp = inspect(engine)
+            cache = _SchemaCache(
+                inspector=insp,
+                fetched_at=time.monotonic(),
+                tables=sorted(insp.get_table_names()),
+                views=sorted(insp.get_view_names()),
+            )
+            _schema_caches[db_url] = cache
+        return cache
+
+
+# One catalog query for every table's row count instead of a COUNT(*) per table
+_ROW_COUNT_SQL = {
+    "mssql": """
+        SELECT OBJECT_NAME(object_id) AS name, SUM(rows) AS row_count
+        FROM sys.partitions
+        WHERE index_id IN (0, 1) AND OBJECT_SCHEMA_NAME(object_id) = SCHEMA_NAME()
+        GROUP BY object_id
+    """,
+    "postgresql": """
+        SELECT c.relname AS name, c.reltuples::bigint AS row_count
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema() AND c.relkind IN ('r', 'p')
+    """,
+}
+
+
+def _fetch_row_counts(engine: Engine, tables: list[str]) -> dict[str, int | None]:
+    """Fetch row counts for all tables on a single connection.
+
+    SQL Server (sys.partitions) and PostgreSQL (pg_class.reltuples) read approximate
+    counts from the catalog in one metadata-only query; sys.partitions needs no
+    VIEW DATABASE STATE permission. Other dialects fall back to COUNT(*) per table,
+    still over one connection. Views are never counted.
+    """
+    with engine.connect() as conn:
+        sql = _ROW_COUNT_SQL.get(engine.dialect.name)
+        if sql is not None:
+            counts: dict[str, int] = {name: count for name, count in conn.execute(text(sql)) if count is not None}
+            # reltuples is -1 for tables that have never been analyzed
+            return {t: int(counts[t]) if counts.get(t, -1) >= 0 else None for t in tables}
+
+        row_counts: dict[str, int | None] = {}
+        for t in tables:
+            quoted = engine.dialect.identifier_preparer.quote(t)
+            row_counts[t] = conn.execute(text(f"SELECT COUNT(*) FROM {quoted}")).scalar()
+        return row_counts
+
+
+def _format_cell(value: object, width: int = 30) -> str:
+    """Render a sample value for the markdown table without stringifying large values."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<{len(value)}B>"
+    if isinstance(value, str):
+        return value[:width]
+    return str(value)[:width]
+
 
 def _is_mssql(db_url: str) -> bool:
     """Check if the database URL points to SQL Server."""
     return "mssql" in db_url.lower()
 
 
+def _introspect(
+    db_url: str,
+    engine: Engine,
+    table_name: str | None,
+    include_sample_data: bool,
+    sample_limit: int,
+    refresh: bool,
+) -> str:
+    """Build the introspect_schema response. Blocking; Agno runs sync tools in a worker thread."""
+    mssql = _is_mssql(db_url)
+    try:
+        schema = _get_schema_cache(db_url, engine, refresh=refresh)
+
+        if table_name is None:
+            # List all tables AND views (mining DBs use V_ views extensively)
+            tables = schema.tables
+            views = schema.views
+
+            if not tables and not views:
+                return "No tables or views found."
+
+            row_counts = schema.get_row_counts(engine)
+
+            # Catalog counts are estimates; only the COUNT(*) fallback is exact
+            approx = "~" if engine.dialect.name in _ROW_COUNT_SQL else ""
+            lines = ["## Tables", ""]
+            for t in tables:
+                count = row_counts.get(t)
+                if count is not None:
+                    lines.append(f"- **{t}** ({approx}{count:,} rows)")
+                else:
+                    lines.append(f"- **{t}**")
+
+            if views:
+                lines.extend(["", "## Views", ""])
+                for v in views:
+                    lines.append(f"- **{v}**")
+
+            return "\n".join(lines)
+
+        # Inspect specific table or view
+        all_tables = schema.tables
+
+        match = schema.resolve(table_name)
+        if match is None:
+            suggestions = schema.suggest(table_name)
+            if suggestions:
+                return f"Table/view '{table_name}' not found. Did you mean: {', '.join(suggestions)}?"
+            return f"Table/view '{table_name}' not found. Call introspect_schema() to list tables and views."
+        table_name = match
+
+        lines = [f"## {table_name}", ""]
+
+        # Columns
+        cols = schema.get_columns(table_name)
+        if cols:
+            lines.extend(["### Columns", "", "| Column | Type | Nullable |", "| --- | --- | --- |"])
+            for c in cols:
+                nullable = "Yes" if c.get("nullable", True) else "No"
+                lines.append(f"| {c['name']} | {c['type']} | {nullable} |")
+            lines.append("")
+
+        # Primary key (tables only, views don't have PKs)
+        if table_name in all_tables:
+            pk = schema.get_pk_constraint(table_name)
+            if pk and pk.get("constrained_columns"):
+                lines.append(f"**Primary Key:** {', '.join(pk['constrained_columns'])}")
+                lines.append("")
+
+        # Sample data
+        if include_sample_data:
+            lines.append("### Sample")
+            try:
+                with engine.connect() as conn:
+                    quoted = f"[{table_name}]" if mssql else f'"{table_name}"'
+                    if mssql:
+                        sql = f"SELECT TOP {sample_limit} * FROM {quoted}"
+                    else:
+                        sql = f"SELECT * FROM {quoted} LIMIT {sample_limit}"
+                    result = conn.execution_options(stream_results=True, max_row_buffer=sample_limit).execute(text(sql))
+                    rows = result.fetchmany(sample_limit)
+                    col_names = list(result.keys())
+                    if rows:
+                        lines.append("| " + " | ".join(col_names) + " |")
+                        lines.append("| " + " | ".join(["---"] * len(col_names)) + " |")
+                        for row in rows:
+                            lines.append("| " + " | ".join(_format_cell(v) for v in row) + " |")
+                    else:
+                        lines.append("_No data_")
+            except (OperationalError, DatabaseError) as e:
+                lines.append(f"_Error: {e}_")
+
+        return "\n".join(lines)
+
+    except OperationalError as e:
+        logger.error(f"Database connection failed: {e}")
+        return f"Error: Database connection failed - {e}"
+    except DatabaseError as e:
+        logger.error(f"Database error: {e}")
+        return f"Error: {e}"
+
+
 def create_introspect_schema_tool(db_url: str):
     """Create introspect_schema tool with database connection."""
-    engine = create_engine(db_url)
-    mssql = _is_mssql(db_url)
+    engine = get_sql_engine(db_url)
 
+    # Kept synchronous so dash.run()/print_response() still work: Agno rejects async tools on the
+    # sync path, while arun() already offloads sync tools via asyncio.to_thread, so parallel tool
+    # calls overlap without blocking the event loop.
     @tool
     def introspect_schema(
         table_name: str | None = None,
         include_sample_data: bool = False,
         sample_limit: int = 5,
+        refresh: bool = False,
     ) -> str:
         """Inspect database schema at runtime.
 
@@ -32,97 +278,8 @@ def create_introspect_schema_tool(db_url: str):
             table_name: Table or view to inspect. If None, lists all tables and views.
             include_sample_data: Include sample rows.
             sample_limit: Number of sample rows.
+            refresh: Re-read the schema instead of using cached metadata (use after schema changes).
         """
-        try:
-            insp = inspect(engine)
-
-            if table_name is None:
-                # List all tables AND views (mining DBs use V_ views extensively)
-                tables = sorted(insp.get_table_names())
-                views = sorted(insp.get_view_names())
-
-                if not tables and not views:
-                    return "No tables or views found."
-
-                lines = ["## Tables", ""]
-                for t in tables:
-                    try:
-                        with engine.connect() as conn:
-                            quoted = f"[{t}]" if mssql else f'"{t}"'
-                            count = conn.execute(text(f"SELECT COUNT(*) FROM {quoted}")).scalar()
-                            lines.append(f"- **{t}** ({count:,} rows)")
-                    except (OperationalError, DatabaseError):
-                        lines.append(f"- **{t}**")
-
-                if views:
-                    lines.extend(["", "## Views", ""])
-                    for v in views:
-                        lines.append(f"- **{v}**")
-
-                return "\n".join(lines)
-
-            # Inspect specific table or view
-            all_tables = insp.get_table_names()
-            all_views = insp.get_view_names()
-            all_objects = all_tables + all_views
-
-            if table_name not in all_objects:
-                # Case-insensitive fallback (SQL Server is case-insensitive)
-                match = next((o for o in all_objects if o.lower() == table_name.lower()), None)
-                if match:
-                    table_name = match
-                else:
-                    return f"Table/view '{table_name}' not found. Available: {', '.join(sorted(all_objects[:50]))}..."
-
-            lines = [f"## {table_name}", ""]
-
-            # Columns
-            cols = insp.get_columns(table_name)
-            if cols:
-                lines.extend(["### Columns", "", "| Column | Type | Nullable |", "| --- | --- | --- |"])
-                for c in cols:
-                    nullable = "Yes" if c.get("nullable", True) else "No"
-                    lines.append(f"| {c['name']} | {c['type']} | {nullable} |")
-                lines.append("")
-
-            # Primary key (tables only, views don't have PKs)
-            if table_name in all_tables:
-                pk = insp.get_pk_constraint(table_name)
-                if pk and pk.get("constrained_columns"):
-                    lines.append(f"**Primary Key:** {', '.join(pk['constrained_columns'])}")
-                    lines.append("")
-
-            # Sample data
-            if include_sample_data:
-                lines.append("### Sample")
-                try:
-                    with engine.connect() as conn:
-                        quoted = f"[{table_name}]" if mssql else f'"{table_name}"'
-                        if mssql:
-                            sql = f"SELECT TOP {sample_limit} * FROM {quoted}"
-                        else:
-                            sql = f"SELECT * FROM {quoted} LIMIT {sample_limit}"
-                        result = conn.execute(text(sql))
-                        rows = result.fetchall()
-                        col_names = list(result.keys())
-                        if rows:
-                            lines.append("| " + " | ".join(col_names) + " |")
-                            lines.append("| " + " | ".join(["---"] * len(col_names)) + " |")
-                            for row in rows:
-                                vals = [str(v)[:30] if v else "NULL" for v in row]
-                                lines.append("| " + " | ".join(vals) + " |")
-                        else:
-                            lines.append("_No data_")
-                except (OperationalError, DatabaseError) as e:
-                    lines.append(f"_Error: {e}_")
-
-            return "\n".join(lines)
-
-        except OperationalError as e:
-            logger.error(f"Database connection failed: {e}")
-            return f"Error: Database connection failed - {e}"
-        except DatabaseError as e:
-            logger.error(f"Database error: {e}")
-            return f"Error: {e}"
+        return _introspect(db_url, engine, table_name, include_sample_data, sample_limit, refresh)
 
     return introspect_schema
@@ -9,12 +9,26 @@ Two databases are supported:
 - agent_db_url: PostgreSQL for agent state and vector storage
 """
 
-from db.session import get_postgres_db
-from db.url import agent_db_url, data_db_url, db_url
+from typing import Any
+
+from db.session import get_postgres_db, get_sql_engine
+from db.url import DbConfig, get_db_config
 
 __all__ = [
+    "DbConfig",
     "agent_db_url",
     "data_db_url",
     "db_url",
+    "get_db_config",
     "get_postgres_db",
+    "get_sql_engine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer reading the environment until a URL is first used
+    if name in ("agent_db_url", "data_db_url", "db_url"):
+        from db import url
+
+        return getattr(url, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
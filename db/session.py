@@ -9,15 +9,25 @@ Uses two separate databases:
 - SQL Server (or other) for data queries
 """
 
+from functools import cache
+from typing import Any
+
 from agno.db.postgres import PostgresDb
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 
-from db.url import agent_db_url
+from db.url import build_agent_db_url
 
 DB_ID = "dash-db"
 
 
+@cache
 def get_postgres_db(contents_table: str | None = None) -> PostgresDb:
-    """Create a PostgresDb instance for agent state/vector storage.
+    """Get the PostgresDb instance for agent state/vector storage.
+
+    Instances are memoized by contents_table and all use the shared agent
+    database engine, so the agents, knowledge bases and AgentOS draw from
+    one connection pool.
 
     Args:
         contents_table: Optional table name for storing knowledge contents.
@@ -25,6 +35,33 @@ def get_postgres_db(contents_table: str | None = None) -> PostgresDb:
     Returns:
         Configured PostgresDb instance.
     """
+    engine = get_sql_engine(build_agent_db_url())
     if contents_table is not None:
-        return PostgresDb(id=DB_ID, db_url=agent_db_url, knowledge_table=contents_table)
-    return PostgresDb(id=DB_ID, db_url=agent_db_url)
+        return PostgresDb(id=DB_ID, db_engine=engine, knowledge_table=contents_table)
+    return PostgresDb(id=DB_ID, db_engine=engine)
+
+
+@cache
+def get_sql_engine(db_url: str) -> Engine:
+    """Get the pooled SQLAlchemy engine for a database URL.
+
+    Engines are memoized by URL, so every tool querying the same database
+    shares one warm connection pool.
+
+    Args:
+        db_url: SQLAlchemy database URL.
+
+    Returns:
+        Shared Engine instance.
+    """
+    url = make_url(db_url)
+    engine_kwargs: dict[str, Any] = {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    if url.get_backend_name() == "mssql" and url.get_driver_name() == "pyodbc":
+        # Bulk parameter binding for executemany() instead of one round trip per row
+        engine_kwargs["fast_executemany"] = True
+    return create_engine(url, **engine_kwargs)
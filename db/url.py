@@ -9,17 +9,193 @@ Supports two databases:
 - AGENT_DB_*: PostgreSQL for agent state and vector storage
 """
 
-from os import getenv
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cache, wraps
+from itertools import product
 from urllib.parse import quote
 
-from dotenv import load_dotenv
+from agno.utils.log import logger
+
+# DASH_PROFILE_ENV=1 logs how long .env parsing and the config build take. It is read
+# before .env is loaded, so set it in the real environment.
+_PROFILE_ENV = os.environ.get("DASH_PROFILE_ENV") == "1"
+
+
+def _profiled(func: Callable[[], "DbConfig"]) -> Callable[[], "DbConfig"]:
+    """Log the wall time of the config build when DASH_PROFILE_ENV is set."""
+    if not _PROFILE_ENV:
+        return func
+
+    @wraps(func)
+    def wrapper() -> "DbConfig":
+        start = time.perf_counter_ns()
+        try:
+            return func()
+        finally:
+            logger.info(f"{func.__name__}: {(time.perf_counter_ns() - start) / 1000:.1f}us")
+
+    return wrapper
+
+
+# Parse .env once per process tree: reloads (and child processes, which inherit the
+# already-loaded variables) skip it. Containers configured with real environment variables
+# have no .env file, so python-dotenv is only imported when there is one to read.
+# DOTENV_PATH overrides the default of .env in the project root.
+_DOTENV_SENTINEL = "_DASH_DOTENV_LOADED"
+if _DOTENV_SENTINEL not in os.environ:
+    _dotenv_path = os.environ.get("DOTENV_PATH") or os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
+    _dotenv_start = time.perf_counter_ns()
+    if os.path.isfile(_dotenv_path):
+        from dotenv import load_dotenv
+
+        load_dotenv(_dotenv_path)
+    os.environ[_DOTENV_SENTINEL] = "1"
+    if _PROFILE_ENV:
+        logger.info(f"load_dotenv({_dotenv_path}): {(time.perf_counter_ns() - _dotenv_start) / 1000:.1f}us")
+
+# Environment variables read by each builder, with their defaults
+_DATA_DB_ENV = {
+    "DATA_DB_DRIVER": "mssql+pyodbc",
+    "DATA_DB_HOST": "localhost",
+    "DATA_DB_PORT": "1433",
+    "DATA_DB_USER": "",
+    "DATA_DB_PASS": "",
+    "DATA_DB_DATABASE": "master",
+    "DATA_DB_TRUSTED_CONNECTION": "",
+}
+_AGENT_DB_ENV = {
+    "AGENT_DB_DRIVER": "postgresql+psycopg",
+    "AGENT_DB_HOST": "localhost",
+    "AGENT_DB_PORT": "5432",
+    "AGENT_DB_USER": "ai",
+    "AGENT_DB_PASS": "ai",
+    "AGENT_DB_DATABASE": "ai",
+}
+
+
+# Accepted spellings of DATA_DB_TRUSTED_CONNECTION, in every letter case, so the raw value is
+# matched with one set lookup
+_TRUTHY = frozenset(
+    "".join(chars) for word in ("yes", "true", "1") for chars in product(*({c.lower(), c.upper()} for c in word))
+)
+
+# The ODBC driver name is process-constant; encode it (spaces -> %20) once at import
+_ODBC_DRIVER_ENC = quote(os.environ.get("DATA_DB_ODBC_DRIVER", "ODBC Driver 17 for SQL Server"), safe="")
+
+
+def _read_env(defaults: dict[str, str]) -> dict[str, str]:
+    """Read a group of environment variables in one pass over os.environ."""
+    environ = os.environ
+    return {key: environ.get(key, default) for key, default in defaults.items()}
+
+
+# URL shapes, filled with str.format_map
+_URL_TEMPLATE = "{driver}://{user}:{password}@{host}:{port}/{database}"
+_PYODBC_URL_TEMPLATE = _URL_TEMPLATE + "?driver={odbc_driver}"
+_PYODBC_TRUSTED_URL_TEMPLATE = "{driver}://@{host}:{port}/{database}?driver={odbc_driver}&Trusted_Connection=yes"
+
+
+@dataclass(frozen=True, slots=True)
+class DbConfig:
+    """Database settings for both databases, read from the environment once.
+
+    Fields holding credentials (passwords and the URLs that embed them) are kept out of repr().
+    """
+
+    data_url: str = field(repr=False)
+    data_driver: str
+    data_host: str
+    data_port: str
+    data_user: str
+    data_password: str = field(repr=False)
+    data_database: str
+    data_trusted_connection: bool
+    agent_url: str = field(repr=False)
+    agent_driver: str
+    agent_host: str
+    agent_port: str
+    agent_user: str
+    agent_password: str = field(repr=False)
+    agent_database: str
+
+
+def _data_db_url(env: dict[str, str]) -> str:
+    """Format the SQL Server URL from the DATA_DB_* variables."""
+    driver = env["DATA_DB_DRIVER"]
+    parts = {
+        "driver": driver,
+        "user": env["DATA_DB_USER"],
+        "password": quote(env["DATA_DB_PASS"], safe=""),
+        "host": env["DATA_DB_HOST"],
+        "port": env["DATA_DB_PORT"],
+        "database": env["DATA_DB_DATABASE"],
+    }
 
-load_dotenv()
+    if "pyodbc" in driver:
+        parts["odbc_driver"] = _ODBC_DRIVER_ENC
+
+        if env["DATA_DB_TRUSTED_CONNECTION"] in _TRUTHY:
+            # Windows Authentication — no user/pass in URL
+            return _PYODBC_TRUSTED_URL_TEMPLATE.format_map(parts)
+
+        # SQL Server Authentication
+        return _PYODBC_URL_TEMPLATE.format_map(parts)
+
+    # Non-pyodbc drivers
+    return _URL_TEMPLATE.format_map(parts)
+
+
+def _agent_db_url(env: dict[str, str]) -> str:
+    """Format the PostgreSQL URL from the AGENT_DB_* variables."""
+    return _URL_TEMPLATE.format_map(
+        {
+            "driver": env["AGENT_DB_DRIVER"],
+            "user": env["AGENT_DB_USER"],
+            "password": quote(env["AGENT_DB_PASS"], safe=""),
+            "host": env["AGENT_DB_HOST"],
+            "port": env["AGENT_DB_PORT"],
+            "database": env["AGENT_DB_DATABASE"],
+        }
+    )
+
+
+@cache
+@_profiled
+def get_db_config() -> DbConfig:
+    """Get the database settings, read from the environment on first call and shared afterwards.
+
+    The URL builders and the module-level URLs are all derived from this object, so
+    environment changes after the first call are not picked up anywhere.
+    """
+    data = _read_env(_DATA_DB_ENV)
+    agent = _read_env(_AGENT_DB_ENV)
+    return DbConfig(
+        data_url=_data_db_url(data),
+        data_driver=data["DATA_DB_DRIVER"],
+        data_host=data["DATA_DB_HOST"],
+        data_port=data["DATA_DB_PORT"],
+        data_user=data["DATA_DB_USER"],
+        data_password=data["DATA_DB_PASS"],
+        data_database=data["DATA_DB_DATABASE"],
+        data_trusted_connection=data["DATA_DB_TRUSTED_CONNECTION"] in _TRUTHY,
+        agent_url=_agent_db_url(agent),
+        agent_driver=agent["AGENT_DB_DRIVER"],
+        agent_host=agent["AGENT_DB_HOST"],
+        agent_port=agent["AGENT_DB_PORT"],
+        agent_user=agent["AGENT_DB_USER"],
+        agent_password=agent["AGENT_DB_PASS"],
+        agent_database=agent["AGENT_DB_DATABASE"],
+    )
 
 
 def build_data_db_url() -> str:
     """Build SQL Server connection URL for data queries.
 
+    The URL comes from get_db_config(); environment changes after the first call are not picked up.
+
     Supports both SQL Server Authentication and Windows Authentication.
     For Windows Auth, set DATA_DB_TRUSTED_CONNECTION=yes and leave USER/PASS empty.
 
@@ -31,40 +207,16 @@ def build_data_db_url() -> str:
         DATA_DB_PASS: Database password (leave empty for Windows Auth)
         DATA_DB_DATABASE: Database name
         DATA_DB_ODBC_DRIVER: ODBC driver name (default: ODBC Driver 17 for SQL Server)
-        DATA_DB_TRUSTED_CONNECTION: Set to 'yes' for Windows Authentication
+        DATA_DB_TRUSTED_CONNECTION: Set to 'yes' (or 'true'/'1') for Windows Authentication
     """
-    driver = getenv("DATA_DB_DRIVER", "mssql+pyodbc")
-    host = getenv("DATA_DB_HOST", "localhost")
-    port = getenv("DATA_DB_PORT", "1433")
-    user = getenv("DATA_DB_USER", "")
-    password = quote(getenv("DATA_DB_PASS", ""), safe="")
-    database = getenv("DATA_DB_DATABASE", "master")
-    odbc_driver = getenv("DATA_DB_ODBC_DRIVER", "ODBC Driver 17 for SQL Server")
-    trusted = getenv("DATA_DB_TRUSTED_CONNECTION", "").lower()
-
-    if "pyodbc" in driver:
-        odbc_driver_encoded = quote(odbc_driver, safe="")
-
-        if trusted == "yes":
-            # Windows Authentication — no user/pass in URL
-            return (
-                f"{driver}://@{host}:{port}/{database}"
-                f"?driver={odbc_driver_encoded}"
-                f"&Trusted_Connection=yes"
-            )
-
-        # SQL Server Authentication
-        base_url = f"{driver}://{user}:{password}@{host}:{port}/{database}"
-        return f"{base_url}?driver={odbc_driver_encoded}"
-
-    # Non-pyodbc drivers
-    base_url = f"{driver}://{user}:{password}@{host}:{port}/{database}"
-    return base_url
+    return get_db_config().data_url
 
 
 def build_agent_db_url() -> str:
     """Build PostgreSQL connection URL for agent state and vector storage.
 
+    The URL comes from get_db_config(); environment changes after the first call are not picked up.
+
     Environment variables:
         AGENT_DB_DRIVER: SQLAlchemy driver (default: postgresql+psycopg)
         AGENT_DB_HOST: Database host (default: localhost)
@@ -73,21 +225,25 @@ def build_agent_db_url() -> str:
         AGENT_DB_PASS: Database password (default: ai)
         AGENT_DB_DATABASE: Database name (default: ai)
     """
-    driver = getenv("AGENT_DB_DRIVER", "postgresql+psycopg")
-    host = getenv("AGENT_DB_HOST", "localhost")
-    port = getenv("AGENT_DB_PORT", "5432")
-    user = getenv("AGENT_DB_USER", "ai")
-    password = quote(getenv("AGENT_DB_PASS", "ai"), safe="")
-    database = getenv("AGENT_DB_DATABASE", "ai")
-
-    return f"{driver}://{user}:{password}@{host}:{port}/{database}"
-
-
-# Data database URL (SQL Server - for querying your data)
-data_db_url = build_data_db_url()
-
-# Agent database URL (PostgreSQL - for agent state and vector storage)
-agent_db_url = build_agent_db_url()
-
-# Legacy alias for backwards compatibility
-db_url = agent_db_url
+    return get_db_config().agent_url
+
+
+# Module attributes built on first access (PEP 562):
+#   data_db_url  - SQL Server, for querying your data
+#   agent_db_url - PostgreSQL, for agent state and vector storage
+#   db_url       - legacy alias for agent_db_url, kept for backwards compatibility
+_LAZY_URLS = {
+    "data_db_url": build_data_db_url,
+    "agent_db_url": build_agent_db_url,
+    "db_url": build_agent_db_url,
+}
+
+
+def __getattr__(name: str) -> str:
+    builder = _LAZY_URLS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    # Later lookups hit the module dict directly and skip __getattr__
+    globals()[name] = value
+    return value